@@ -1,13 +1,37 @@
 from typing import Optional
 
-from .convert import CoverPalette
-from .album_art import get_best_cover_art_url
-from .colorblind import is_colorblind_friendly
+__all__ = ["CoverPalette", "get_best_cover_art_url", "is_colorblind_friendly", "get_cmap"]
+
+# Submodules pull in matplotlib, scikit-learn and the HTTP clients, so they are
+# imported on first attribute access (PEP 562) rather than with the package
+_LAZY_ATTRS = {
+    "CoverPalette": ".convert",
+    "get_best_cover_art_url": ".album_art",
+    "is_colorblind_friendly": ".colorblind",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
 
 
 def get_cmap(artist: str, album: str, n_colors: int = 4, random_state: Optional[int] = None):
     """Return a colormap for ``artist`` and ``album`` in a single call."""
 
+    from .convert import CoverPalette
+
     palette = CoverPalette(artist, album)
     return palette.generate_cmap(n_colors=n_colors, random_state=random_state)
 
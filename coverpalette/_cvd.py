@@ -0,0 +1,95 @@
+"""Compiled kernels for the color-blind friendliness check.
+
+Importing this module requires numba. :mod:`coverpalette.colorblind` imports it
+lazily and falls back to its NumPy implementation when numba is not installed.
+"""
+
+import math
+
+import numpy as np
+from numba import njit
+
+from .colorblind import _CVD_MATRICES, DEFICIENCIES, DEUTER, PROTAN, TRITAN
+
+# Global tuples are frozen into the compiled code as constants
+_PROTAN_MATRIX = _CVD_MATRICES[DEFICIENCIES[PROTAN]]
+_DEUTER_MATRIX = _CVD_MATRICES[DEFICIENCIES[DEUTER]]
+_TRITAN_MATRIX = _CVD_MATRICES[DEFICIENCIES[TRITAN]]
+
+# Rec. 601 luma weights used to order colors before the pairwise scan
+_LUMA_R, _LUMA_G, _LUMA_B = 0.299, 0.587, 0.114
+_LUMA_NORM = math.sqrt(_LUMA_R ** 2 + _LUMA_G ** 2 + _LUMA_B ** 2)
+
+
+@njit(cache=True, fastmath=True, inline="always")
+def _color_distance_sq(colors, i, j):
+    """Squared Euclidean distance between rows ``i`` and ``j`` of ``colors``, unrolled."""
+
+    dr = colors[i, 0] - colors[j, 0]
+    dg = colors[i, 1] - colors[j, 1]
+    db = colors[i, 2] - colors[j, 2]
+    return dr * dr + dg * dg + db * db
+
+
+@njit(cache=True, fastmath=True, inline="always")
+def _simulate(colors, matrix):
+    """Apply the constant 3x3 ``matrix`` to each row of ``colors``."""
+
+    n = colors.shape[0]
+    simulated = np.empty_like(colors)
+    for i in range(n):
+        r = colors[i, 0]
+        g = colors[i, 1]
+        b = colors[i, 2]
+        for k in range(3):
+            row = matrix[k]
+            simulated[i, k] = r * row[0] + g * row[1] + b * row[2]
+    return simulated
+
+
+@njit(cache=True, fastmath=True)
+def cvd_friendly(colors, deficiency_id, threshold_sq):
+    """Return ``True`` if ``colors`` stay distinct for a color vision deficiency.
+
+    ``colors`` is an ``(N, 3)`` array of RGB values, ``deficiency_id`` one of
+    the ids from :mod:`coverpalette.colorblind` and ``threshold_sq`` the
+    squared minimum distance between any two simulated colors.
+    """
+
+    # Each branch sees its matrix as a compile-time constant, so the zero
+    # entries are folded away instead of being multiplied for every color
+    if deficiency_id == PROTAN:
+        simulated = _simulate(colors, _PROTAN_MATRIX)
+    elif deficiency_id == DEUTER:
+        simulated = _simulate(colors, _DEUTER_MATRIX)
+    else:
+        simulated = _simulate(colors, _TRITAN_MATRIX)
+    return distinct(simulated, threshold_sq)
+
+
+@njit(cache=True, fastmath=True)
+def distinct(simulated, threshold_sq):
+    """Return ``True`` if all rows of ``simulated`` are ``threshold_sq`` apart."""
+
+    n = simulated.shape[0]
+    luma = np.empty(n, dtype=simulated.dtype)
+    for i in range(n):
+        luma[i] = (
+            _LUMA_R * simulated[i, 0] + _LUMA_G * simulated[i, 1] + _LUMA_B * simulated[i, 2]
+        )
+
+    # Luma is a projection of each color, so two colors whose luma differs by
+    # more than ``threshold * _LUMA_NORM`` are at least ``threshold`` apart.
+    # Scanning in luma order checks the likeliest collisions first and lets
+    # the inner loop stop as soon as the remaining colors are too far away.
+    order = np.argsort(luma)
+    luma_gap = math.sqrt(threshold_sq) * _LUMA_NORM
+    for p in range(n):
+        i = order[p]
+        for q in range(p + 1, n):
+            j = order[q]
+            if luma[j] - luma[i] > luma_gap:
+                break
+            if _color_distance_sq(simulated, i, j) < threshold_sq:
+                return False
+    return True
@@ -1,15 +1,22 @@
-import pylast
 import requests
 import json
 import os
-import pkg_resources
-import musicbrainzngs
-import discogs_client
+import threading
 import time
-from fuzzywuzzy import fuzz
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from pathlib import Path
+from rapidfuzz import fuzz, process
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# The Last.fm, MusicBrainz and Discogs clients are imported by the functions
+# using them, so a cached cover or a saved palette never pays for them
 
 api_key = None
 discogs_token = None
+KEYS_FILE = Path(__file__).with_name("keys.json")
 
 
 def load_api_keys():
@@ -18,9 +25,8 @@ def load_api_keys():
     if api_key is not None or discogs_token is not None:
         return api_key, discogs_token
 
-    keys_path = pkg_resources.resource_filename("coverpalette", "keys.json")
-    if os.path.exists(keys_path):
-        with open(keys_path, "r") as f:
+    if KEYS_FILE.exists():
+        with KEYS_FILE.open("r") as f:
             config = json.load(f)
             api_key = config.get("lastfm", {}).get("api_key")
             discogs_token = config.get("discogs", {}).get("token")
@@ -34,9 +40,29 @@ USER_AGENT = "coverpalette"
 USER_AGENT_VERSION = "0.1"
 USER_AGENT_URL = "http://idonthaveawebsite.com"
 COVER_ART_URL_TEMPLATE = "https://coverartarchive.org/release/{}/front-500"
-
-def get_lastfm_cover_art_url(api_key, artist_name, album_name, max_retries=3):
+# Seconds to wait on a cover art source before trying the next one
+LOOKUP_TIMEOUT = 10
+# Seconds a source has to answer before the next one is queried as well
+HEDGE_DELAY = 2
+# Seconds to wait when checking that a cover exists
+HTTP_TIMEOUT = 5
+
+# Shared so repeated checks against the Cover Art Archive reuse connections
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = f"{USER_AGENT}/{USER_AGENT_VERSION} ( {USER_AGENT_URL} )"
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=10,
+        max_retries=Retry(total=2, backoff_factor=0.2),
+    ),
+)
+
+def get_lastfm_cover_art_url(api_key, artist_name, album_name, max_retries=3, log=print):
     """ Fetches the album cover art URL from the Last.fm API for a given artist and album."""
+    import pylast
+
     network = pylast.LastFMNetwork(api_key=api_key)
     album = network.get_album(artist_name, album_name)
 
@@ -46,20 +72,22 @@ def get_lastfm_cover_art_url(api_key, artist_name, album_name, max_retries=3):
             if cover_art_url:
                 return cover_art_url
         except Exception as e:
-            print(f"Error fetching cover art for {album_name}: {e}")
+            log(f"Error fetching cover art for {album_name}: {e}")
             time.sleep(2)  # Wait for 2 seconds before retrying
 
     return None
 
 
-def check_list_in_result(result, key, name):
+def check_list_in_result(result, key, name, log=print):
     if not (key in result and result[key]):
-        print(f"{key.replace('-', ' ').capitalize()} not found for {name}")
+        log(f"{key.replace('-', ' ').capitalize()} not found for {name}")
         return False
     return True
 
-def get_mb_cover_art_url(artist_name, album_name):
+def get_mb_cover_art_url(artist_name, album_name, log=print):
     """ Get cover art URL using MusicBrainz data and artist and album names """
+    import musicbrainzngs
+
     musicbrainzngs.set_useragent(USER_AGENT, USER_AGENT_VERSION, USER_AGENT_URL)
     # artist_name = artist_name.lower()
     # album_name = album_name.lower()
@@ -70,48 +98,64 @@ def get_mb_cover_art_url(artist_name, album_name):
         release_group_result = musicbrainzngs.search_release_groups(artist=artist_name, release=album_name, limit=5)
 
         # Use fuzzy string matching to find the best match
-        best_match = None
-        highest_ratio = 0
+        release_groups = release_group_result['release-group-list']
+        candidates = [
+            f"{release_group['artist-credit'][0]['artist']['name']} - {release_group['title']}".lower()
+            for release_group in release_groups
+        ]
         match_threshold = 80
-        for release_group in release_group_result['release-group-list']:
-            ratio = fuzz.ratio(name.lower(), f"{release_group['artist-credit'][0]['artist']['name']} - {release_group['title']}".lower())
-            if ratio > highest_ratio and ratio >= match_threshold:
-                highest_ratio = ratio
-                best_match = release_group
+        # fuzz.ratio scores are floats, fuzzywuzzy rounded them to ints, so
+        # anything that rounds up to the threshold still matches
+        best_match = process.extractOne(
+            name.lower(),
+            candidates,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=match_threshold - 0.5,
+        )
 
         if best_match is None:
-            print(f"Release group not found for {name}")
+            log(f"Release group not found for {name}")
             return None
 
-        release_group_id = best_match['id']
+        release_group_id = release_groups[best_match[2]]['id']
 
         releases_result = musicbrainzngs.browse_releases(release_group=release_group_id, limit=1)
 
-        if not check_list_in_result(releases_result, 'release-list', name):
+        if not check_list_in_result(releases_result, 'release-list', name, log=log):
             return None
 
         release = releases_result['release-list'][0]
         release_id = release['id']
         cover_art_url = COVER_ART_URL_TEMPLATE.format(release_id)
 
-        #Check if cover art exists
-        with requests.get(cover_art_url, stream=True) as response:
-            if response.status_code != 200:
-                print(f"Cover art not found for {name}")
-                return None
+        #Check if cover art exists, the archive redirects to the image itself
+        response = _SESSION.head(cover_art_url, allow_redirects=True, timeout=HTTP_TIMEOUT)
+        if response.status_code != 200:
+            log(f"Cover art not found for {name}")
+            return None
 
         return cover_art_url
 
     except musicbrainzngs.MusicBrainzError as e:
-        print(f"Error fetching cover art for {name}: {e}")
+        log(f"Error fetching cover art for {name}: {e}")
     except requests.exceptions.RequestException as e:
-        print(f"Error checking cover art existence for {name}: {e}")
+        log(f"Error checking cover art existence for {name}: {e}")
 
     return None
 
-def get_discogs_cover_art_url(artist_name, album_name, user_token):
+@lru_cache(maxsize=1)
+def _get_discogs_client(user_token):
+    """Return a Discogs client for ``user_token``, created on first use."""
+    import discogs_client
+
+    return discogs_client.Client("coverpalette/0.1", user_token=user_token)
+
+def get_discogs_cover_art_url(artist_name, album_name, user_token, log=print):
     """ Fetches the album cover art URL from the Discogs API for a given artist and album."""
-    d = discogs_client.Client("coverpalette/0.1", user_token=user_token)
+    import discogs_client
+
+    d = _get_discogs_client(user_token)
     try:
         discogs_search = d.search(artist=artist_name, release_title=album_name, type="release")
         results = discogs_search.page(1)
@@ -123,15 +167,35 @@ def get_discogs_cover_art_url(artist_name, album_name, user_token):
                 cover_art_url = best_match.images[0].get("uri")
             if cover_art_url:
                 return cover_art_url
-            print(f"Cover art not found for {artist_name} - {album_name}")
+            log(f"Cover art not found for {artist_name} - {album_name}")
         else:
-            print(f"Release not found for {artist_name} - {album_name}")
+            log(f"Release not found for {artist_name} - {album_name}")
 
     except discogs_client.exceptions.HTTPError as e:
-        print(f"Error fetching cover art from Discogs for {artist_name} - {album_name}: {e}")
+        log(f"Error fetching cover art from Discogs for {artist_name} - {album_name}: {e}")
 
     return None
 
+def _start_lookup(lookup, args):
+    """Run ``lookup(*args)`` on a daemon thread.
+
+    Returns a future for the result and the list the lookup's messages are
+    collected in. Daemon threads do not keep the interpreter alive, so a
+    lookup that is no longer needed never delays exit.
+    """
+
+    future = Future()
+    messages = []
+
+    def run():
+        try:
+            future.set_result(lookup(*args, log=messages.append))
+        except BaseException as error:
+            future.set_exception(error)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future, messages
+
 def get_best_cover_art_url(artist_name, album_name, api_key=None, user_token=None):
     """Fetch the album cover art URL using the best available method."""
     if api_key is None or user_token is None:
@@ -141,21 +205,40 @@ def get_best_cover_art_url(artist_name, album_name, api_key=None, user_token=Non
         if user_token is None:
             user_token = loaded_discogs
 
+    # Sources in order of preference
+    lookups = []
+    if api_key:
+        lookups.append(("last.fm", get_lastfm_cover_art_url, (api_key, artist_name, album_name)))
+    lookups.append(("MusicBrainz", get_mb_cover_art_url, (artist_name, album_name)))
+    if user_token is not None:
+        lookups.append(("Discogs", get_discogs_cover_art_url, (artist_name, album_name, user_token)))
+
+    # Give each source a head start and only query the next one if it fails
+    # or is slow to answer, so the result is the same as asking them in turn
+    # and less preferred sources are rarely hit at all
+    running = []
     cover_art_url = None
+    for index, (source, _, _) in enumerate(lookups):
+        if index == len(running):
+            running.append(_start_lookup(*lookups[index][1:]))
+        future, messages = running[index]
+        print(f"Attempting to get cover art from {source}")
 
-    if api_key:
-        # Try Last.fm first if API key is provided
-        print("Attempting to get cover art from last.fm")
-        cover_art_url = get_lastfm_cover_art_url(api_key, artist_name, album_name)
-    
-    if not cover_art_url:
-        # Try MusicBrainz if no cover art was found or if no Last.fm API key was provided
-        print("Attempting to get cover art from MusicBrainz")
-        cover_art_url = get_mb_cover_art_url(artist_name, album_name)
-
-    if not cover_art_url and user_token != None:
-        # Try Discogs if no cover art was found in previous methods if discog token is provided
-        print("Attempting to get cover art from Discogs")
-        cover_art_url = get_discogs_cover_art_url(artist_name, album_name, user_token)
+        deadline = time.monotonic() + LOOKUP_TIMEOUT
+        try:
+            if index + 1 < len(lookups):
+                try:
+                    future.result(timeout=HEDGE_DELAY)
+                except FutureTimeoutError:
+                    running.append(_start_lookup(*lookups[index + 1][1:]))
+            cover_art_url = future.result(timeout=max(0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            messages.append(f"Timed out getting cover art from {source}")
+
+        # Messages are printed only for the sources whose result is used
+        for message in messages:
+            print(message)
+        if cover_art_url:
+            break
 
     return cover_art_url
@@ -0,0 +1,114 @@
+"""On-disk cache of downloaded album covers.
+
+Resolving a cover URL and downloading the image is by far the slowest part of
+creating a palette, so the image bytes and the URL they came from are kept
+under ``CACHE_DIR`` keyed by a hash of the artist and album. Once the cache
+grows past ``CACHE_MAX_BYTES`` the oldest covers are removed.
+"""
+
+import hashlib
+import json
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Tuple
+from urllib.request import urlopen
+
+CACHE_DIR = Path.home() / ".cache" / "coverpalette"
+# Covers older than this many seconds are fetched again
+CACHE_TTL = 30 * 24 * 60 * 60
+# Total size of cached covers kept on disk
+CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+
+def _cache_key(artist: str, album: str) -> str:
+    """Return the file name stem used for ``artist`` and ``album``."""
+
+    name = f"{artist.strip().lower()}|{album.strip().lower()}"
+    return hashlib.sha256(name.encode("utf-8")).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` so readers never see a partial file."""
+
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def load_cover(artist: str, album: str) -> Optional[Tuple[str, bytes]]:
+    """Return the cached ``(url, image bytes)`` for an album.
+
+    Returns ``None`` if nothing is cached or the entry is older than
+    ``CACHE_TTL``.
+    """
+
+    key = _cache_key(artist, album)
+    image_file = CACHE_DIR / f"{key}.img"
+    meta_file = CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - image_file.stat().st_mtime > CACHE_TTL:
+            return None
+        with meta_file.open("r") as f:
+            url = json.load(f)["url"]
+        return url, image_file.read_bytes()
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def store_cover(artist: str, album: str, url: str, data: bytes) -> None:
+    """Cache the cover ``data`` downloaded from ``url`` for an album.
+
+    Failing to write the cache is not an error, the cover is simply
+    downloaded again next time.
+    """
+
+    key = _cache_key(artist, album)
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _write_atomic(CACHE_DIR / f"{key}.img", data)
+        meta = {"artist": artist, "album": album, "url": url}
+        _write_atomic(CACHE_DIR / f"{key}.json", json.dumps(meta).encode("utf-8"))
+        _evict(CACHE_MAX_BYTES)
+    except OSError:
+        pass
+
+
+def _evict(max_bytes: int) -> None:
+    """Delete the oldest cached covers until the cache fits in ``max_bytes``."""
+
+    entries = []
+    total = 0
+    for image_file in CACHE_DIR.glob("*.img"):
+        meta_file = image_file.with_suffix(".json")
+        try:
+            st = image_file.stat()
+            size = st.st_size + (meta_file.stat().st_size if meta_file.exists() else 0)
+        except OSError:
+            continue
+        entries.append((st.st_mtime, size, image_file, meta_file))
+        total += size
+
+    if total <= max_bytes:
+        return
+
+    entries.sort(key=lambda entry: entry[0])
+    for _, size, image_file, meta_file in entries:
+        if total <= max_bytes:
+            break
+        for path in (image_file, meta_file):
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        total -= size
+
+
+@lru_cache(maxsize=32)
+def fetch_image(url: str) -> bytes:
+    """Download ``url`` and return the raw bytes, memoized per process."""
+
+    with urlopen(url) as response:
+        return response.read()
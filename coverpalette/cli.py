@@ -1,24 +1,110 @@
-import argparse
 import sys
-from .convert import CoverPalette
+from functools import lru_cache
+
+
+def _parse_list_args(argv):
+    """Parse ``--page`` and ``--per-page`` for ``coverpalette list`` without argparse.
+
+    Returns ``None`` for anything else (``--pdf``, ``--help``, bad values) so the
+    caller can fall back to the full argparse parser.
+    """
+    options = {"page": 1, "per_page": 10}
+    tokens = iter(argv)
+    for token in tokens:
+        flag, has_value, value = token.partition("=")
+        if flag not in ("--page", "--per-page"):
+            return None
+        if not has_value:
+            value = next(tokens, None)
+        try:
+            options[flag[2:].replace("-", "_")] = int(value)
+        except (TypeError, ValueError):
+            return None
+    return options
+
+
+@lru_cache(maxsize=1)
+def _list_parser():
+    """Return the argument parser for ``coverpalette list``."""
+    import argparse
+
+    list_parser = argparse.ArgumentParser(
+        prog="coverpalette list", description="List saved palettes"
+    )
+    list_parser.add_argument("--page", type=int, default=1, help="Page number")
+    list_parser.add_argument(
+        "--per-page", type=int, default=10, help="Palettes per page"
+    )
+    list_parser.add_argument(
+        "--pdf", action="store_true", help="Show a PDF of all palettes"
+    )
+    return list_parser
+
+
+@lru_cache(maxsize=1)
+def _delete_parser():
+    """Return the argument parser for ``coverpalette delete``."""
+    import argparse
+
+    del_parser = argparse.ArgumentParser(
+        prog="coverpalette delete", description="Delete a saved palette"
+    )
+    del_parser.add_argument("id", type=int, help="Palette id to delete")
+    return del_parser
+
+
+@lru_cache(maxsize=1)
+def _parser():
+    """Return the argument parser for creating a palette."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Create color palettes from album covers"
+    )
+    parser.add_argument("artist", help="Name of the artist")
+    parser.add_argument("album", help="Name of the album")
+    parser.add_argument("-n", "--n-colors", type=int, default=4, help="Number of colors")
+    parser.add_argument(
+        "-m",
+        "--max-colors",
+        type=int,
+        default=10,
+        help="Maximum colors to consider when generating the palette",
+    )
+    parser.add_argument("--random-state", type=int, default=None, help="Random seed")
+    parser.add_argument(
+        "--hue",
+        action="store_true",
+        help="Maximize hue separation when selecting colors",
+    )
+    parser.add_argument("--light", action="store_true", help="Prefer lighter colors")
+    parser.add_argument("--dark", action="store_true", help="Prefer darker colors")
+    parser.add_argument(
+        "--bold", action="store_true", help="Prefer high saturation colors"
+    )
+    parser.add_argument(
+        "--save",
+        action="store_true",
+        help="Save without previewing the palette",
+    )
+    return parser
 
 
 def main() -> None:
     """Entry point for the ``coverpalette`` command."""
     if len(sys.argv) > 1 and sys.argv[1] == "list":
-        list_parser = argparse.ArgumentParser(
-            prog="coverpalette list", description="List saved palettes"
-        )
-        list_parser.add_argument("--page", type=int, default=1, help="Page number")
-        list_parser.add_argument(
-            "--per-page", type=int, default=10, help="Palettes per page"
-        )
-        list_parser.add_argument(
-            "--pdf", action="store_true", help="Show a PDF of all palettes"
-        )
-        args = list_parser.parse_args(sys.argv[2:])
+        # Plain listing only reads the index, so skip argparse and the
+        # matplotlib/scikit-learn imports behind ``CoverPalette``
+        options = _parse_list_args(sys.argv[2:])
+        show_pdf = False
+        if options is None:
+            args = _list_parser().parse_args(sys.argv[2:])
+            options = {"page": args.page, "per_page": args.per_page}
+            show_pdf = args.pdf
+
+        if show_pdf:
+            from .convert import CoverPalette
 
-        if args.pdf:
             path = CoverPalette.create_palettes_pdf()
             if not path:
                 print("No saved palettes found")
@@ -37,7 +123,9 @@ def main() -> None:
                 print(f"PDF saved to {path}")
             return
 
-        entries = CoverPalette.list_palettes(page=args.page, per_page=args.per_page)
+        from .storage import list_palettes
+
+        entries = list_palettes(**options)
         if not entries:
             print("No saved palettes found")
             return
@@ -51,67 +139,42 @@ def main() -> None:
         return
 
     if len(sys.argv) > 1 and sys.argv[1] == "delete":
-        del_parser = argparse.ArgumentParser(
-            prog="coverpalette delete", description="Delete a saved palette"
-        )
-        del_parser.add_argument("id", type=int, help="Palette id to delete")
-        args = del_parser.parse_args(sys.argv[2:])
+        from .storage import delete_palette
+
+        args = _delete_parser().parse_args(sys.argv[2:])
 
-        if CoverPalette.delete_palette(args.id):
+        if delete_palette(args.id):
             print(f"Deleted palette {args.id}")
         else:
             print(f"Palette {args.id} not found")
         return
 
     # Support an unquoted "artist - album" form by rewriting sys.argv
+    # Find the separating dash and the first option after it in one pass
     args = sys.argv[1:]
-    if "-" in args:
-        dash = args.index("-")
+    dash = -1
+    first_option = len(args)
+    for i, token in enumerate(args):
+        if dash < 0:
+            if token == "-":
+                dash = i
+        elif token.startswith("-"):
+            first_option = i
+            break
+    if dash >= 0:
         artist_tokens = args[:dash]
-        rest = args[dash + 1 :]
-        album_tokens = []
-        options = []
-        for i, token in enumerate(rest):
-            if token.startswith("-"):
-                options = rest[i:]
-                break
-            album_tokens.append(token)
+        album_tokens = args[dash + 1 : first_option]
+        options = args[first_option:]
         if artist_tokens and album_tokens:
             sys.argv = (
                 [sys.argv[0], " ".join(artist_tokens), " ".join(album_tokens)]
                 + options
             )
 
-    parser = argparse.ArgumentParser(
-        description="Create color palettes from album covers"
-    )
-    parser.add_argument("artist", help="Name of the artist")
-    parser.add_argument("album", help="Name of the album")
-    parser.add_argument("-n", "--n-colors", type=int, default=4, help="Number of colors")
-    parser.add_argument(
-        "-m",
-        "--max-colors",
-        type=int,
-        default=10,
-        help="Maximum colors to consider when generating the palette",
-    )
-    parser.add_argument("--random-state", type=int, default=None, help="Random seed")
-    parser.add_argument(
-        "--hue",
-        action="store_true",
-        help="Maximize hue separation when selecting colors",
-    )
-    parser.add_argument("--light", action="store_true", help="Prefer lighter colors")
-    parser.add_argument("--dark", action="store_true", help="Prefer darker colors")
-    parser.add_argument(
-        "--bold", action="store_true", help="Prefer high saturation colors"
-    )
-    parser.add_argument(
-        "--save",
-        action="store_true",
-        help="Save without previewing the palette",
-    )
-    args = parser.parse_args()
+    args = _parser().parse_args()
+
+    from .colorblind import DEFICIENCIES
+    from .convert import CoverPalette
 
     palette = CoverPalette(args.artist, args.album)
     if args.hue:
@@ -139,6 +202,9 @@ def main() -> None:
         pid = palette.save_palette()
         print(f"Palette saved as #{pid}")
     else:
+        for deficiency_id, deficiency in enumerate(DEFICIENCIES):
+            friendly = palette.colorblind_friendly(cmap, deficiency=deficiency_id)
+            print(f"  {deficiency}:", friendly)
         palette.preview_palette(cmap)
         ans = input("Save this palette? [y/N] ").strip().lower()
         if ans in {"y", "yes"}:
@@ -1,8 +1,10 @@
 import colorsys
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
 from urllib.error import HTTPError
 from urllib.error import URLError
-from urllib.request import urlopen
 import json
+import os
 from pathlib import Path
 from typing import Optional, Union
 import matplotlib.pyplot as plt
@@ -13,51 +15,106 @@ from kneed import KneeLocator
 from PIL import Image
 from sklearn.cluster import KMeans
 from matplotlib.colors import ListedColormap
+from matplotlib.figure import Figure
 from sklearn.cluster import MiniBatchKMeans
 from .album_art import get_best_cover_art_url, load_api_keys
+from .cache import fetch_image, load_cover, store_cover
 from .colorblind import is_colorblind_friendly
-from scipy.spatial.distance import pdist, squareform
+from . import storage
+from .storage import PALETTE_DIR, INDEX_FILE, _load_index
+from scipy.spatial.distance import pdist
 
-# Directory where palettes are stored
-PALETTE_DIR = Path.home() / ".coverpalette" / "palettes"
-INDEX_FILE = PALETTE_DIR / "index.json"
+# Above this many distinct colors generate_cmap falls back to MiniBatchKMeans
+MINIBATCH_MIN_ROWS = 10000
+# Rows passed to each MiniBatchKMeans.partial_fit call
+MINIBATCH_SIZE = 1024
 
-def _ensure_palette_dir() -> None:
-    """Create the palette directory if it does not exist."""
-    PALETTE_DIR.mkdir(parents=True, exist_ok=True)
 
+def _rgb_to_hsv(colors: np.ndarray) -> np.ndarray:
+    """Vectorized :func:`colorsys.rgb_to_hsv` for an ``(N, 3)`` array."""
 
-def _load_index(assign_ids: bool = False) -> list:
-    """Return the contents of ``index.json`` upgrading entries if needed.
+    r, g, b = colors[:, 0], colors[:, 1], colors[:, 2]
+    maxc = colors.max(axis=1)
+    minc = colors.min(axis=1)
+    rangec = maxc - minc
+    gray = rangec == 0
+    # Avoid dividing by zero for grays, whose hue and saturation are 0
+    safe_range = np.where(gray, 1, rangec)
+    rc = (maxc - r) / safe_range
+    gc = (maxc - g) / safe_range
+    bc = (maxc - b) / safe_range
+    h = np.where(r == maxc, bc - gc, np.where(g == maxc, 2.0 + rc - bc, 4.0 + gc - rc))
+    h = np.where(gray, 0.0, (h / 6.0) % 1.0)
+    s = np.where(gray, 0.0, rangec / np.where(maxc == 0, 1, maxc))
+    return np.column_stack((h, s, maxc))
 
-    When ``assign_ids`` is ``True`` any palette entries missing an ``id``
-    field are assigned a numeric identifier and the file is updated on disk.
+
+def _rgb_to_hex(colors: np.ndarray) -> list:
+    """Return ``#rrggbb`` strings for an ``(N, 3)`` array of RGB values in [0, 1]."""
+
+    rgb = np.round(np.asarray(colors, dtype=float)[:, :3] * 255).astype(np.uint8)
+    return ["#%02x%02x%02x" % tuple(c) for c in rgb.tolist()]
+
+
+def _cover_bytes(entry: dict) -> bytes:
+    """Return the cover image of a saved palette, from the cover cache if possible."""
+
+    img_url = entry["image_url"]
+    cached = load_cover(entry.get("artist") or "", entry.get("album") or "")
+    if cached and cached[0] == img_url:
+        return cached[1]
+    return fetch_image(img_url)
+
+
+def _render_palettes_page(chunk: list) -> bytes:
+    """Render one page of the saved palettes PDF and return it as PDF bytes.
+
+    This runs in worker processes, so it builds a bare :class:`Figure` rather
+    than going through pyplot and the interactive backend.
     """
 
-    _ensure_palette_dir()
+    rows = len(chunk)
+    fig = Figure(figsize=(8, rows))
+    axes = fig.subplots(
+        rows,
+        3,
+        gridspec_kw={"width_ratios": [1, 3, 2]},
+    )
+
+    axes_list = axes if rows > 1 else [axes]
+
+    for (img_ax, bar_ax, text_ax), entry in zip(axes_list, chunk):
+        for ax in (img_ax, bar_ax, text_ax):
+            ax.axis("off")
+
+        hexcodes = entry.get("hexcodes") or []
+        cmap = ListedColormap([mpl.colors.to_rgb(h) for h in hexcodes])
+
+        gradient = np.linspace(0, 1, 256).reshape(1, -1)
+        bar_ax.imshow(gradient, aspect="auto", cmap=cmap)
+
+        artist = (entry.get("artist") or "").title()
+        album = (entry.get("album") or "").title()
+        pid = entry.get("id")
+        text = (
+            f"#{pid} {artist} - {album} "
+            f"({entry.get('n_colors')} colors)\n"
+            + " ".join(hexcodes)
+        )
+        text_ax.text(0, 0.5, text, va="center", ha="left", fontsize=8)
+
+        if entry.get("image_url"):
+            try:
+                with Image.open(BytesIO(_cover_bytes(entry))) as img:
+                    img_ax.imshow(img)
+            except Exception:
+                pass
+
+    fig.tight_layout(pad=0.25)
+    buffer = BytesIO()
+    fig.savefig(buffer, format="pdf")
+    return buffer.getvalue()
 
-    if INDEX_FILE.exists():
-        try:
-            with INDEX_FILE.open("r") as f:
-                data = json.load(f)
-        except json.JSONDecodeError:
-            data = []
-    else:
-        data = []
-
-    if assign_ids:
-        next_id = max([entry.get("id", 0) for entry in data], default=0)
-        updated = False
-        for entry in data:
-            if "id" not in entry:
-                next_id += 1
-                entry["id"] = next_id
-                updated = True
-        if updated:
-            with INDEX_FILE.open("w") as f:
-                json.dump(data, f, indent=2)
-
-    return data
 
 class CoverPalette:
     """
@@ -66,12 +123,13 @@ class CoverPalette:
     Args:
         artist (str): The name of the artist.
         album (str): The name of the album.
+        max_dim (int | None): Largest side of the image used for clustering. Defaults to 128.
 
     Attributes:
         image_path (str): The URL of the cover art image.
         album (str): The name of the album.
         image (PIL.Image): The PIL Image object of the cover art.
-        pixels (numpy.ndarray): A numpy array of RGB values representing the cover art.
+        pixels (numpy.ndarray): An (N, 3) uint8 numpy array of RGB values representing the cover art.
         transparent_pixels (numpy.ndarray): A boolean numpy array where True indicates the corresponding pixel in the cover art is transparent.
         kmeans (KMeans): The KMeans object after fitting to the RGB values. None if the `fit_kmeans` method has not been called.
         hexcodes (list): The list of hexcodes representing the dominant colors in the cover art. None if the `get_hexcodes` method has not been called.
@@ -79,41 +137,118 @@ class CoverPalette:
             the latest generated palette for color-blind friendliness.
     """
 
-    def __init__(self, artist, album):
+    def __init__(self, artist, album, max_dim=128):
         """
         Initializes the CoverPalette object by fetching the cover art and converting it to a numpy array of RGB values.
-        """
-        api_key, discogs_token = load_api_keys()
 
-        cover_art_url = get_best_cover_art_url(
-            artist,
-            album,
-            api_key=api_key,
-            user_token=discogs_token,
-        )
-        if not cover_art_url:
-            raise ValueError(f"Cover art not found for {artist} - {album}")
+        The cover is shrunk to fit within ``max_dim`` x ``max_dim`` pixels
+        before its colors are extracted. Pass ``None`` to cluster the full
+        resolution image.
+        """
+        cached = load_cover(artist, album)
+        if cached:
+            cover_art_url, image_bytes = cached
+        else:
+            api_key, discogs_token = load_api_keys()
+
+            cover_art_url = get_best_cover_art_url(
+                artist,
+                album,
+                api_key=api_key,
+                user_token=discogs_token,
+            )
+            if not cover_art_url:
+                raise ValueError(f"Cover art not found for {artist} - {album}")
+            image_bytes = None
 
         self.artist = artist
         self.image_path = cover_art_url
         self.album = album
+        downloaded = image_bytes is None
         try:
-            self.image = Image.open(urlopen(self.image_path))
+            if downloaded:
+                image_bytes = fetch_image(self.image_path)
+            self.image = Image.open(BytesIO(image_bytes))
         except (URLError, HTTPError) as error:
             raise URLError(f"Could not open {self.image_path} {error}") from error
         except ValueError as error:
             raise ValueError(f"Could not open {self.image_path} {error}") from error
+        if downloaded:
+            store_cover(artist, album, self.image_path, image_bytes)
 
         # convert the image to a numpy array
         self.image = self.image.convert("RGBA")
-        self.pixels = np.array(self.image.getdata())
+        # Kept for displaying the cover without downloading it again
+        self._img_array = np.asarray(self.image)
+        # The palette does not depend on fine detail, so colors are taken
+        # from a thumbnail while the full image is kept for display
+        pixel_array = self._img_array
+        if max_dim is not None and max(self.image.size) > max_dim:
+            thumbnail = self.image.copy()
+            thumbnail.thumbnail((max_dim, max_dim), Image.Resampling.BILINEAR)
+            pixel_array = np.asarray(thumbnail)
+        # One uint8 row per pixel, read through the buffer protocol
+        self.pixels = pixel_array.reshape(-1, 4)
 
         # Find transparent pixels and store them in case we want to remove transparency
         self.transparent_pixels = self.pixels[:, 3] == 0
-        self.pixels = self.pixels[:, :3]
+        self.pixels = np.ascontiguousarray(self.pixels[:, :3])
+        self._unique_pixels = None
+        self._pixel_counts = None
+        self._batches = None
         self.kmeans = None
         self.hexcodes = None
         self.is_colorblind_friendly = None
+        self._sim_cache = {}
+        self._sim_cache_colors = None
+
+    def _weighted_pixels(self):
+        """Return representative colors for ``self.pixels`` and their pixel counts.
+
+        Each channel is reduced to 5 bits, which bounds the number of distinct
+        colors to 32768 regardless of image size. Every non-empty bin is
+        represented by the mean color of its pixels and weighted by their
+        number, so clustering these rows approximates clustering every pixel
+        at a fraction of the cost and flat regions keep their exact color.
+        The result is cached until the pixels change.
+        """
+
+        if self._unique_pixels is None:
+            q = (self.pixels >> 3).astype(np.intp)
+            keys = (q[:, 0] << 10) | (q[:, 1] << 5) | q[:, 2]
+            counts = np.bincount(keys, minlength=1 << 15)
+            bins = np.flatnonzero(counts)
+            bin_rgb = np.column_stack(
+                [
+                    np.bincount(keys, weights=self.pixels[:, c], minlength=1 << 15)[bins]
+                    for c in range(3)
+                ]
+            ) / counts[bins, None]
+            # float32 C-contiguous rows are what KMeans works on, so every fit
+            # in generate_optimal_cmap uses them without converting again
+            self._unique_pixels = np.ascontiguousarray(bin_rgb, dtype=np.float32)
+            self._pixel_counts = counts[bins].astype(np.float32)
+        return self._unique_pixels, self._pixel_counts
+
+    def _minibatches(self):
+        """Return the weighted colors split into shuffled ``MINIBATCH_SIZE`` batches.
+
+        The colors come out of :meth:`_weighted_pixels` ordered by bin, so they
+        are shuffled once to make every batch representative. The batches are
+        cached alongside the colors and reused for every ``k``.
+        """
+
+        if self._batches is None:
+            unique_pixels, counts = self._weighted_pixels()
+            order = np.random.default_rng(0).permutation(len(unique_pixels))
+            self._batches = [
+                (unique_pixels[idx], counts[idx])
+                for idx in (
+                    order[start : start + MINIBATCH_SIZE]
+                    for start in range(0, len(order), MINIBATCH_SIZE)
+                )
+            ]
+        return self._batches
 
     def hexcodes_to_hsv(self):
         """Return ``self.hexcodes`` converted to HSV values."""
@@ -168,10 +303,103 @@ class CoverPalette:
         Returns:
             matplotlib.colors.ListedColormap: A matplotlib ListedColormap object.
         """
-        # create a kmeans model
-        self.kmeans = MiniBatchKMeans(n_clusters=n_colors, random_state=random_state, n_init=3)
-        # fit the model to the pixels
-        self.kmeans.fit(self.pixels)
+        self.kmeans = self._fit_kmeans(n_colors, random_state=random_state)
+        return self._cmap_from_kmeans(palette_name)
+
+    def _fit_kmeans(self, n_colors, random_state=None, init=None):
+        """Fit k-means with ``n_colors`` clusters to the quantized pixel colors.
+
+        ``init`` optionally gives the initial cluster centers, otherwise
+        k-means++ seeding is used.
+        """
+
+        unique_pixels, counts = self._weighted_pixels()
+        # k-means needs at least one row per cluster, so a cover with fewer
+        # distinct colors is fitted with one cluster per color
+        n_clusters = min(n_colors, len(unique_pixels))
+        # create a kmeans model, full k-means is cheap on the quantized colors
+        if len(unique_pixels) > MINIBATCH_MIN_ROWS:
+            kmeans = MiniBatchKMeans(
+                n_clusters=n_clusters,
+                init="k-means++" if init is None else init,
+                n_init=1,
+                batch_size=MINIBATCH_SIZE,
+                compute_labels=False,
+                random_state=random_state,
+            )
+            # One pass over the pre-built batches instead of a full fit, which
+            # validates and samples the whole array again for every k
+            for batch, weights in self._minibatches():
+                kmeans.partial_fit(batch, sample_weight=weights)
+            # partial_fit only sees one batch at a time, so label every color
+            # at the end for the inertia and the next cluster split
+            kmeans.labels_ = kmeans.predict(unique_pixels)
+            kmeans.inertia_ = -kmeans.score(unique_pixels, sample_weight=counts)
+        else:
+            kmeans = KMeans(
+                n_clusters=n_clusters,
+                init="k-means++" if init is None else init,
+                n_init=1,
+                algorithm="elkan",
+                random_state=random_state,
+            )
+            # fit the model to the quantized pixel colors weighted by frequency
+            kmeans.fit(unique_pixels, sample_weight=counts)
+
+        if n_clusters < n_colors:
+            # Repeat centers to still return ``n_colors`` colors, as k-means
+            # on every pixel did when clusters collapsed onto the same color
+            centers = kmeans.cluster_centers_
+            kmeans.cluster_centers_ = centers[np.arange(n_colors) % n_clusters]
+        return kmeans
+
+    def _split_largest_cluster(self):
+        """Return ``k + 1`` initial centers by splitting the worst cluster of ``self.kmeans``.
+
+        The cluster with the largest weighted sum of squared errors is
+        replaced by two centers one standard deviation either side of it
+        along its principal axis, which is how bisecting k-means grows.
+        Returns ``None`` once every distinct color has its own cluster, as
+        there is nothing left to split.
+        """
+
+        points, weights = self._weighted_pixels()
+        centers = self.kmeans.cluster_centers_
+        labels = self.kmeans.labels_
+        if len(centers) >= len(points):
+            return None
+
+        residuals = points - centers[labels]
+        sse = np.bincount(
+            labels,
+            weights=weights * np.einsum("ij,ij->i", residuals, residuals),
+            minlength=len(centers),
+        )
+        worst = np.argmax(sse)
+
+        members = labels == worst
+        member_weights = weights[members]
+        spread = residuals[members]
+        cov = (spread * member_weights[:, None]).T @ spread / member_weights.sum()
+        eigvals, eigvecs = np.linalg.eigh(cov)
+        offset = eigvecs[:, -1] * np.sqrt(max(eigvals[-1], 0.0))
+
+        return np.vstack(
+            [
+                np.delete(centers, worst, axis=0),
+                centers[worst] - offset,
+                centers[worst] + offset,
+            ]
+        )
+
+    def _cmap_from_kmeans(self, palette_name=None, compute_hex=True):
+        """Build the hue sorted ListedColormap for the centers of ``self.kmeans``.
+
+        With ``compute_hex`` the hexcodes and the color-blind check of the new
+        palette are recorded as well, which callers trying several palettes
+        only need for the one they keep.
+        """
+
         # get the cluster centers
         centroids = self.kmeans.cluster_centers_ / 255
         # return the palette
@@ -182,14 +410,15 @@ class CoverPalette:
         # Handle 4 dimension RGBA colors
         cmap.colors = cmap.colors[:, :3]
 
-        # Sort colors by hue
-        cmap.colors = sorted(cmap.colors, key=lambda rgb: colorsys.rgb_to_hsv(*rgb))
+        # Sort colors by hue, then saturation and value like the HSV tuples would
+        hsv = _rgb_to_hsv(cmap.colors)
+        cmap.colors = cmap.colors[np.lexsort((hsv[:, 2], hsv[:, 1], hsv[:, 0]))]
         # Handle cases where all rgb values evaluate to 1 or 0. This is a temporary fix
-        cmap.colors = np.where(np.isclose(cmap.colors, 1), 1 - 1e-6, cmap.colors)
-        cmap.colors = np.where(np.isclose(cmap.colors, 0), 1e-6, cmap.colors)
+        cmap.colors = np.clip(cmap.colors, 1e-6, 1 - 1e-6)
 
-        self.hexcodes = [mpl.colors.rgb2hex(c) for c in cmap.colors]
-        self.is_colorblind_friendly = self.colorblind_friendly(cmap)
+        if compute_hex:
+            self.hexcodes = _rgb_to_hex(cmap.colors)
+            self.is_colorblind_friendly = self.colorblind_friendly(cmap)
         return cmap
 
     def generate_optimal_cmap(self, max_colors=10, palette_name=None, random_state=None):
@@ -219,19 +448,25 @@ class CoverPalette:
         cmaps = dict()
         if not palette_name:
             palette_name = self.album
+        # Each k starts from the k - 1 solution with its worst cluster split,
+        # so the fits converge in a few iterations instead of starting over.
+        # Past one cluster per distinct color the split gives no centers and
+        # the fit just repeats the colors found so far.
         for n_colors in range(2, max_colors + 1):
-            cmap = self.generate_cmap(n_colors=n_colors, palette_name=palette_name, random_state=random_state)
-            cmaps[n_colors] = cmap
+            init = self._split_largest_cluster() if n_colors > 2 else None
+            self.kmeans = self._fit_kmeans(n_colors, random_state=random_state, init=init)
+            cmaps[n_colors] = self._cmap_from_kmeans(palette_name, compute_hex=False)
             ssd[n_colors] = self.kmeans.inertia_
 
         best_n_colors = KneeLocator(list(ssd.keys()), list(ssd.values()), curve="convex", direction="decreasing").knee
-        try:
-            self.hexcodes = [mpl.colors.rgb2hex(c) for c in cmaps[best_n_colors].colors]
-        except KeyError:
-            # Kneed did not find an optimal point so we don't record any hex values
-            self.hexcodes = None
+        # Only the selected palette gets hexcodes and a color-blind check
         if best_n_colors in cmaps:
+            self.hexcodes = _rgb_to_hex(cmaps[best_n_colors].colors)
             self.is_colorblind_friendly = self.colorblind_friendly(cmaps[best_n_colors])
+        else:
+            # Kneed did not find an optimal point so we don't record any hex values
+            self.hexcodes = None
+            self.is_colorblind_friendly = None
         return cmaps, best_n_colors, ssd
     
     def get_distinct_colors(
@@ -309,10 +544,11 @@ class CoverPalette:
             )
 
             # Calculate the total pairwise distance between the colors
-            distinctness = np.sum(squareform(pdist(distinct_colors)))
+            distinctness = pdist(distinct_colors).sum()
 
-            # If this set of colors is more distinct than the best so far, update the best
-            if distinctness > max_distinctness:
+            # If this set of colors is more distinct than the best so far, update the best.
+            # A cover with a single color scores 0 everywhere, keep its first set
+            if distinctness > max_distinctness or best_distinct_colors is None:
                 max_distinctness = distinctness
                 best_distinct_colors = distinct_colors
                 best_distinct_cmap = distinct_cmap
@@ -392,6 +628,9 @@ class CoverPalette:
             None
         """
         self.pixels = self.pixels[~self.transparent_pixels]
+        self._unique_pixels = None
+        self._pixel_counts = None
+        self._batches = None
 
     def display_with_colorbar(self, cmap):
         """
@@ -404,10 +643,7 @@ class CoverPalette:
         None
         """
         try:
-            # Open the image from the URL
-            with urlopen(self.image_path) as url:
-                with Image.open(url) as img:
-                    img_array = np.array(img)
+            img_array = self._img_array
 
             # Create the plot
             fig, ax = plt.subplots(figsize=(7, 5))
@@ -430,9 +666,7 @@ class CoverPalette:
         """Show the album cover alongside a sample plot using ``cmap``."""
 
         try:
-            with urlopen(self.image_path) as url:
-                with Image.open(url) as img:
-                    img_array = np.array(img)
+            img_array = self._img_array
 
             fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
 
@@ -456,30 +690,50 @@ class CoverPalette:
         except Exception as e:
             print(f"Error displaying preview: {e}")
 
-    def colorblind_friendly(self, cmap, deficiency: str = "deuteranopia", threshold: float = 0.1) -> bool:
+    def colorblind_friendly(
+        self,
+        cmap,
+        deficiency: Union[str, int] = "deuteranopia",
+        threshold: float = 0.1,
+        metric: str = "rgb",
+    ) -> bool:
         """Return ``True`` if ``cmap`` remains distinct for a color vision deficiency.
 
         Parameters
         ----------
         cmap : matplotlib.colors.Colormap
             Colormap to evaluate.
-        deficiency : str, optional
-            One of ``"protanopia"``, ``"deuteranopia"`` or ``"tritanopia"``.
+        deficiency : str or int, optional
+            One of ``"protanopia"``, ``"deuteranopia"`` or ``"tritanopia"``, or
+            the matching id from :mod:`coverpalette.colorblind`.
         threshold : float, optional
             Minimum distance between simulated colors.  Smaller values mark
             colors as indistinguishable.  Defaults to 0.1.
+        metric : str, optional
+            ``"rgb"`` (default) or ``"lab"`` to compare simulated colors by
+            CIELAB Delta E*ab, with ``threshold`` given in Delta E units.
         """
 
         colors = getattr(cmap, "colors", [])
-        return is_colorblind_friendly(colors, deficiency=deficiency, threshold=threshold)
+        # Simulations are reused until a different set of colors is checked
+        if colors is not self._sim_cache_colors:
+            self._sim_cache = {}
+            self._sim_cache_colors = colors
+        return is_colorblind_friendly(
+            colors,
+            deficiency=deficiency,
+            threshold=threshold,
+            cache=self._sim_cache,
+            metric=metric,
+        )
 
     def save_palette(self, path: Optional[str] = None):
         """Save ``self.hexcodes`` and metadata and return the palette id.
 
-        When ``path`` is ``None`` the palette is recorded only in
-        ``index.json`` under ``PALETTE_DIR``.  If a path is supplied the
+        When ``path`` is ``None`` the palette is recorded only in the
+        ``index.db`` database under ``PALETTE_DIR``.  If a path is supplied the
         hexcodes are also written to that location as JSON.  All palette
-        metadata and hexcodes are stored in ``index.json`` so that palettes can
+        metadata and hexcodes are stored in ``index.db`` so that palettes can
         easily be listed and loaded later.  Each palette is assigned a
         numerical ``id`` which can be used for listing, loading and deleting
         palettes.
@@ -498,11 +752,6 @@ class CoverPalette:
         if not self.hexcodes:
             raise ValueError("No palette has been generated to save")
 
-        # Load existing index to determine next id and upgrade if needed
-        data = _load_index(assign_ids=True)
-
-        next_id = max([entry.get("id", 0) for entry in data], default=0) + 1
-
         json_path = Path(path) if path else None
 
         if json_path:
@@ -515,7 +764,6 @@ class CoverPalette:
 
         # Update index metadata
         metadata = {
-            "id": next_id,
             "artist": self.artist,
             "album": self.album,
             "n_colors": len(self.hexcodes),
@@ -524,11 +772,7 @@ class CoverPalette:
             "path": str(json_path) if json_path else None,
         }
 
-        data.append(metadata)
-        with INDEX_FILE.open("w") as f:
-            json.dump(data, f, indent=2)
-
-        return next_id
+        return storage.add_palette(metadata)
 
     def load_palette(self, path: Union[str, Path]):
         """Load hexcodes from ``path`` and set ``self.hexcodes``.
@@ -554,117 +798,56 @@ class CoverPalette:
     def load_palette_by_name(self, name: str):
         """Load a saved palette using its registered ``name``."""
 
-        data = _load_index(assign_ids=True)
-        if not data:
-            raise FileNotFoundError("No saved palettes available")
-
-        data.sort(key=lambda d: d.get("id", 0))
+        entry = storage.find_palette_by_name(name)
+        if entry is None:
+            if not storage.count_palettes():
+                raise FileNotFoundError("No saved palettes available")
+            raise FileNotFoundError(f"Saved palette '{name}' not found")
 
-        for entry in data:
-            if entry.get("name") == name:
-                if entry.get("hexcodes"):
-                    self.hexcodes = entry["hexcodes"]
-                elif entry.get("path"):
-                    self.load_palette(entry["path"])
-                else:
-                    raise FileNotFoundError(f"Palette data for '{name}' missing")
-                self.image_path = entry.get("image_url", self.image_path)
-                return
-
-        raise FileNotFoundError(f"Saved palette '{name}' not found")
+        if entry.get("hexcodes"):
+            self.hexcodes = entry["hexcodes"]
+        elif entry.get("path"):
+            self.load_palette(entry["path"])
+        else:
+            raise FileNotFoundError(f"Palette data for '{name}' missing")
+        self.image_path = entry.get("image_url", self.image_path)
 
     def load_palette_by_id(self, palette_id: int):
         """Load a saved palette using its numeric ``id``."""
 
-        data = _load_index(assign_ids=True)
-        if not data:
-            raise FileNotFoundError("No saved palettes available")
-
-        for entry in data:
-            if entry.get("id") == palette_id:
-                if entry.get("hexcodes"):
-                    self.hexcodes = entry["hexcodes"]
-                elif entry.get("path"):
-                    self.load_palette(entry["path"])
-                else:
-                    raise FileNotFoundError(f"Palette data for id {palette_id} missing")
-                self.image_path = entry.get("image_url", self.image_path)
-                self.artist = entry.get("artist", self.artist)
-                self.album = entry.get("album", self.album)
-                return
-
-        raise FileNotFoundError(f"Saved palette id {palette_id} not found")
+        entry = storage.get_palette(palette_id)
+        if entry is None:
+            if not storage.count_palettes():
+                raise FileNotFoundError("No saved palettes available")
+            raise FileNotFoundError(f"Saved palette id {palette_id} not found")
+
+        if entry.get("hexcodes"):
+            self.hexcodes = entry["hexcodes"]
+        elif entry.get("path"):
+            self.load_palette(entry["path"])
+        else:
+            raise FileNotFoundError(f"Palette data for id {palette_id} missing")
+        self.image_path = entry.get("image_url", self.image_path)
+        self.artist = entry.get("artist", self.artist)
+        self.album = entry.get("album", self.album)
 
     @staticmethod
     def delete_palette(palette_id: int) -> bool:
-        """Remove a palette from ``index.json`` and delete its file if present.
+        """Remove a saved palette, see :func:`coverpalette.storage.delete_palette`."""
 
-        Parameters
-        ----------
-        palette_id : int
-            Numeric id of the palette to remove.
-
-        Returns
-        -------
-        bool
-            ``True`` if a palette was removed, ``False`` otherwise.
-        """
-
-        data = _load_index(assign_ids=True)
-        if not data:
-            return False
-
-        remaining = []
-        removed_entry = None
-        for entry in data:
-            if entry.get("id") == palette_id:
-                removed_entry = entry
-            else:
-                remaining.append(entry)
-
-        if removed_entry is None:
-            return False
-
-        with INDEX_FILE.open("w") as f:
-            json.dump(remaining, f, indent=2)
-
-        palette_path = removed_entry.get("path")
-        if palette_path:
-            try:
-                Path(palette_path).unlink()
-            except OSError:
-                pass
-
-        return True
+        return storage.delete_palette(palette_id)
 
     @staticmethod
     def list_palettes(page: int = 1, per_page: int = 10):
         """Return a paginated list of saved palette metadata."""
 
-        data = _load_index(assign_ids=True)
-        if not data:
-            return []
-
-        data.sort(key=lambda d: d.get("id", 0))
-
-        start = max(0, (page - 1) * per_page)
-        end = start + per_page
-        return data[start:end]
+        return storage.list_palettes(page=page, per_page=per_page)
 
     @staticmethod
     def find_palettes_by_color_count(n_colors: int, page: int = 1, per_page: int = 10):
         """Return saved palettes matching ``n_colors``."""
 
-        data = _load_index(assign_ids=True)
-        if not data:
-            return []
-
-        matches = [entry for entry in data if entry.get("n_colors") == n_colors]
-        matches.sort(key=lambda d: d.get("id", 0))
-
-        start = max(0, (page - 1) * per_page)
-        end = start + per_page
-        return matches[start:end]
+        return storage.find_palettes_by_color_count(n_colors, page=page, per_page=per_page)
 
     @staticmethod
     def pdf_file() -> Path:
@@ -677,11 +860,11 @@ class CoverPalette:
         """Generate a PDF listing saved palettes and return its path.
 
         The PDF is stored under ``PALETTE_DIR`` as ``palettes.pdf``. If the
-        PDF already exists and is newer than ``index.json`` it is reused unless
+        PDF already exists and is newer than ``index.db`` it is reused unless
         ``force`` is ``True``. Returns ``None`` when no palettes are saved.
         """
 
-        data = _load_index(assign_ids=True)
+        data = _load_index()
         if not data:
             return None
 
@@ -691,54 +874,22 @@ class CoverPalette:
             if pdf_path.stat().st_mtime >= INDEX_FILE.stat().st_mtime:
                 return pdf_path
 
-        from matplotlib.backends.backend_pdf import PdfPages
+        from pypdf import PdfWriter
 
         per_page = 10
-        with PdfPages(pdf_path) as pdf:
-            for i in range(0, len(data), per_page):
-                chunk = data[i : i + per_page]
-                rows = len(chunk)
-
-                fig, axes = plt.subplots(
-                    rows,
-                    3,
-                    figsize=(8, rows),
-                    gridspec_kw={"width_ratios": [1, 3, 2]},
-                )
-
-                axes_list = axes if rows > 1 else [axes]
-
-                for (img_ax, bar_ax, text_ax), entry in zip(axes_list, chunk):
-                    for ax in (img_ax, bar_ax, text_ax):
-                        ax.axis("off")
-
-                    hexcodes = entry.get("hexcodes") or []
-                    cmap = ListedColormap([mpl.colors.to_rgb(h) for h in hexcodes])
-
-                    gradient = np.linspace(0, 1, 256).reshape(1, -1)
-                    bar_ax.imshow(gradient, aspect="auto", cmap=cmap)
-
-                    artist = (entry.get("artist") or "").title()
-                    album = (entry.get("album") or "").title()
-                    pid = entry.get("id")
-                    text = (
-                        f"#{pid} {artist} - {album} "
-                        f"({entry.get('n_colors')} colors)\n"
-                        + " ".join(hexcodes)
-                    )
-                    text_ax.text(0, 0.5, text, va="center", ha="left", fontsize=8)
-
-                    img_url = entry.get("image_url")
-                    if img_url:
-                        try:
-                            with urlopen(img_url) as url:
-                                with Image.open(url) as img:
-                                    img_ax.imshow(img)
-                        except Exception:
-                            pass
-
-                plt.tight_layout(pad=0.25)
-                pdf.savefig(fig)
-                plt.close(fig)
+        chunks = [data[i : i + per_page] for i in range(0, len(data), per_page)]
+        if len(chunks) > 1:
+            # Pages are independent, so render them in parallel
+            max_workers = min(len(chunks), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                pages = list(executor.map(_render_palettes_page, chunks))
+        else:
+            pages = [_render_palettes_page(chunk) for chunk in chunks]
+
+        writer = PdfWriter()
+        for page in pages:
+            writer.append(BytesIO(page))
+        with pdf_path.open("wb") as f:
+            writer.write(f)
 
         return pdf_path
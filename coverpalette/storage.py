@@ -0,0 +1,200 @@
+"""Access to the index of saved palettes.
+
+Palette metadata is kept in an SQLite database so single palettes can be
+looked up, filtered and paginated without reading the whole index. This module
+only depends on the standard library so that listing or deleting palettes does
+not pull in matplotlib and scikit-learn.
+"""
+
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+# Directory where palettes are stored
+PALETTE_DIR = Path.home() / ".coverpalette" / "palettes"
+INDEX_FILE = PALETTE_DIR / "index.db"
+# Index written by earlier versions, imported once when the database is created
+JSON_INDEX_FILE = PALETTE_DIR / "index.json"
+
+# Bumped whenever the schema below changes
+_SCHEMA_VERSION = 1
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS palettes (
+    id INTEGER PRIMARY KEY,
+    name TEXT,
+    artist TEXT,
+    album TEXT,
+    n_colors INTEGER,
+    image_url TEXT,
+    hexcodes TEXT,
+    path TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_palettes_name ON palettes(name);
+CREATE INDEX IF NOT EXISTS idx_palettes_n_colors ON palettes(n_colors);
+"""
+_COLUMNS = ("id", "name", "artist", "album", "n_colors", "image_url", "hexcodes", "path")
+
+
+def _ensure_palette_dir() -> None:
+    """Create the palette directory if it does not exist."""
+    PALETTE_DIR.mkdir(parents=True, exist_ok=True)
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the palette database, creating it on first use."""
+
+    _ensure_palette_dir()
+    conn = sqlite3.connect(str(INDEX_FILE))
+    conn.row_factory = sqlite3.Row
+    if conn.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+        with conn:
+            conn.executescript(_SCHEMA)
+            _import_json_index(conn)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+    return conn
+
+
+def _import_json_index(conn: sqlite3.Connection) -> None:
+    """Copy palettes from an ``index.json`` written by earlier versions."""
+
+    try:
+        with JSON_INDEX_FILE.open("r") as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return
+
+    # Entries without an id get the next free one, as the JSON index did
+    next_id = max([entry.get("id", 0) for entry in data], default=0)
+    for entry in data:
+        if "id" not in entry:
+            next_id += 1
+            entry = dict(entry, id=next_id)
+        _insert(conn, entry)
+
+
+def _insert(conn: sqlite3.Connection, entry: dict) -> int:
+    """Insert ``entry`` and return its id."""
+
+    values = dict.fromkeys(_COLUMNS)
+    values.update((key, entry[key]) for key in _COLUMNS if key in entry)
+    values["hexcodes"] = json.dumps(values["hexcodes"])
+    cursor = conn.execute(
+        f"INSERT OR REPLACE INTO palettes ({', '.join(_COLUMNS)}) "
+        f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+        [values[key] for key in _COLUMNS],
+    )
+    return cursor.lastrowid
+
+
+def _row_to_entry(row: sqlite3.Row) -> dict:
+    """Return the metadata dictionary for a ``palettes`` row."""
+
+    entry = {key: row[key] for key in _COLUMNS if row[key] is not None}
+    if "hexcodes" in entry:
+        entry["hexcodes"] = json.loads(entry["hexcodes"])
+    return entry
+
+
+def _query(sql: str, params=()) -> list:
+    """Run a ``SELECT`` on the palette database and return the entries."""
+
+    with closing(_connect()) as conn:
+        return [_row_to_entry(row) for row in conn.execute(sql, params)]
+
+
+def _load_index() -> list:
+    """Return the metadata of every saved palette ordered by id."""
+
+    return _query("SELECT * FROM palettes ORDER BY id")
+
+
+def add_palette(entry: dict) -> int:
+    """Store a palette's metadata and return its id.
+
+    A new id is assigned unless ``entry`` already has one, in which case the
+    palette with that id is replaced.
+    """
+
+    with closing(_connect()) as conn:
+        with conn:
+            return _insert(conn, entry)
+
+
+def get_palette(palette_id: int) -> Optional[dict]:
+    """Return the metadata of the palette with ``palette_id`` or ``None``."""
+
+    entries = _query("SELECT * FROM palettes WHERE id = ?", (palette_id,))
+    return entries[0] if entries else None
+
+
+def find_palette_by_name(name: str) -> Optional[dict]:
+    """Return the palette registered as ``name`` with the lowest id or ``None``."""
+
+    entries = _query("SELECT * FROM palettes WHERE name = ? ORDER BY id LIMIT 1", (name,))
+    return entries[0] if entries else None
+
+
+def count_palettes() -> int:
+    """Return the number of saved palettes."""
+
+    with closing(_connect()) as conn:
+        return conn.execute("SELECT COUNT(*) FROM palettes").fetchone()[0]
+
+
+def delete_palette(palette_id: int) -> bool:
+    """Remove a palette from the index and delete its file if present.
+
+    Parameters
+    ----------
+    palette_id : int
+        Numeric id of the palette to remove.
+
+    Returns
+    -------
+    bool
+        ``True`` if a palette was removed, ``False`` otherwise.
+    """
+
+    with closing(_connect()) as conn:
+        with conn:
+            row = conn.execute("SELECT path FROM palettes WHERE id = ?", (palette_id,)).fetchone()
+            if row is None:
+                return False
+            conn.execute("DELETE FROM palettes WHERE id = ?", (palette_id,))
+
+    palette_path = row["path"]
+    if palette_path:
+        try:
+            Path(palette_path).unlink()
+        except OSError:
+            pass
+
+    return True
+
+
+def list_palettes(page: int = 1, per_page: int = 10):
+    """Return a paginated list of saved palette metadata."""
+
+    start = max(0, (page - 1) * per_page)
+    return _query("SELECT * FROM palettes ORDER BY id LIMIT ? OFFSET ?", (per_page, start))
+
+
+def find_palettes_by_color_count(n_colors: int, page: int = 1, per_page: int = 10):
+    """Return saved palettes matching ``n_colors``."""
+
+    start = max(0, (page - 1) * per_page)
+    # idx_palettes_n_colors stores the id with each entry, so SQLite reads just
+    # the matching rows already in id order, with no scan or sort of the table
+    return _query(
+        "SELECT * FROM palettes WHERE n_colors = ? ORDER BY id LIMIT ? OFFSET ?",
+        (n_colors, per_page, start),
+    )
+
+
+def export_index(path) -> None:
+    """Write the metadata of every saved palette to ``path`` as JSON."""
+
+    with Path(path).open("w") as f:
+        json.dump(_load_index(), f, indent=2)